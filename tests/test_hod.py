@@ -1,9 +1,13 @@
+import weakref
+
 import pytest
 
 import numpy as np
+import scipy.special as sp
+from scipy.optimize import brentq
 
 from halomod import TracerHaloModel, hod
-from halomod.hod import Zehavi05, Zehavi05Marked, Zehavi05WithMax
+from halomod.hod import Contreras13, Zehavi05, Zehavi05Marked, Zehavi05WithMax, Zheng05
 
 
 def test_zehavi_marked():
@@ -42,3 +46,387 @@ def test_positive_hod(hodr):
     assert np.all(hm.hod._tracer_per_central(m) >= 0)
     assert np.all(hm.hod._tracer_per_satellite(m) >= 0)
     assert hm.mean_tracer_den_unit >= 0
+
+
+def test_cached_params_refresh():
+    """Test that in-place parameter updates are picked up by the cached parameters."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zehavi05(M_min=12.0)
+    z05.params["M_min"] = 11.0
+    expected = Zehavi05(M_min=11.0).central_occupation(m)
+
+    assert np.allclose(z05.central_occupation(m), expected)
+    assert np.allclose(z05.nc(m), expected)
+
+
+def test_contreras_occupation():
+    """Test the Contreras13 occupation against its closed-form expression."""
+    m = np.logspace(10, 15, 100)
+    p = {"fcb": 0.3, "fca": 0.4, "x": 1.2, "sig_logm": 0.3, "delta": 0.8, "fs": 2.0}
+    c13 = Contreras13(**p)
+    lm = np.log10(m) - c13.params["M_min"]
+    width = p["x"] * p["sig_logm"]
+
+    nc = p["fcb"] * (1 - p["fca"]) * np.exp(-(lm ** 2) / (2 * width ** 2)) + p[
+        "fca"
+    ] * (1 + sp.erf(lm / width))
+    ns = (
+        p["fs"]
+        * (1 + sp.erf(np.log10(m / 10 ** c13.params["M_1"]) / p["delta"]))
+        * (m / 10 ** c13.params["M_1"]) ** c13.params["alpha"]
+    )
+
+    assert np.allclose(c13.central_occupation(m), nc)
+    assert np.allclose(c13._satellite_occupation(m), ns)
+
+
+def test_leauthaud_occupation():
+    """Test the Leauthaud11 occupation against its closed-form expression."""
+    m = np.logspace(10, 15, 100)
+    l11 = hod.Leauthaud11()
+    p = l11.params
+
+    # Invert the stellar-to-halo mass relation for each halo mass.
+    logmstar = np.array(
+        [
+            brentq(lambda lms: l11.mean_log_halo_mass(lms) - lm, 0, 14)
+            for lm in np.log10(m)
+        ]
+    )
+    nc = 0.5 * (
+        1 - sp.erf((p["sm_thresh"] - logmstar) / (np.sqrt(2) * p["sig_logmstar"]))
+    )
+
+    knee_thresh = 10 ** l11.mean_log_halo_mass(p["sm_thresh"]) / 7.2e11
+    msat = 7.2e11 * p["bsat"] * knee_thresh ** p["betasat"]
+    mcut = 7.2e11 * p["bcut"] * knee_thresh ** p["betacut"]
+    ns = nc * np.exp(-mcut / m) * (m / msat) ** p["alphasat"]
+
+    assert np.allclose(l11.mean_log_stellar_mass(m), logmstar, rtol=0, atol=1e-6)
+    assert np.allclose(l11.central_occupation(m), nc, rtol=1e-6)
+    assert np.allclose(l11.satellite_occupation(m), ns, rtol=1e-6)
+
+
+def test_zheng_central():
+    """Test the Zheng05 central occupation against its closed-form expression."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zheng05()
+    nc = 0.5 * (
+        1 + sp.erf((np.log10(m) - z05.params["M_min"]) / z05.params["sig_logm"])
+    )
+    assert np.allclose(z05.central_occupation(m), nc)
+
+
+def test_zheng_satellite():
+    """Test the Zheng05 satellite occupation against its closed-form expression."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zheng05()
+    m0, m1 = 10 ** z05.params["M_0"], 10 ** z05.params["M_1"]
+    ns = np.where(m > m0, (np.clip(m - m0, 0, None) / m1) ** z05.params["alpha"], 0)
+
+    assert np.allclose(z05._satellite_occupation(m), ns)
+    assert np.all(z05._satellite_occupation(m)[m <= m0] == 0)
+
+
+def test_occupation_cache():
+    """Test that occupations are memoized, and recomputed when parameters change."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zheng05()
+    nc = z05.central_occupation(m)
+
+    assert z05.central_occupation(m) is nc
+    assert not nc.flags.writeable
+    assert np.allclose(z05.central_occupation(m.copy()), nc)
+
+    z05.params["M_min"] = 12.5
+    assert not np.allclose(z05.central_occupation(m), nc)
+    assert np.allclose(
+        z05.central_occupation(m), Zheng05(M_min=12.5).central_occupation(m)
+    )
+
+
+def test_occupation_cache_weakref():
+    """Test that the occupation cache does not keep the input masses alive."""
+    m = np.logspace(10, 15, 100)
+    ref = weakref.ref(m)
+    z05 = Zheng05(dtype=np.float32)
+    z05.central_occupation(m)
+
+    del m
+    assert ref() is None
+    assert not z05._occupation_cache
+
+
+def test_occupation_cache_leauthaud():
+    """Test that Leauthaud11's update of M_min does not clear the occupation cache."""
+    m = np.logspace(10, 15, 100)
+    l11 = hod.Leauthaud11()
+    nc = l11.central_occupation(m)
+    ns = l11.satellite_occupation(m)
+
+    assert l11.central_occupation(m) is nc
+    assert l11.satellite_occupation(m) is ns
+
+
+def test_stale_params_kernel():
+    """Test that private kernels see in-place parameter updates."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zehavi05Marked(M_max=14)
+    z05.central_occupation(m)
+    z05.params["M_min"] = 12.5
+    z05.params["logA"] = 1.0
+
+    expected = Zehavi05Marked(M_max=14, M_min=12.5, logA=1.0)
+
+    assert np.allclose(z05.sigma_central(m), expected.sigma_central(m))
+
+
+@pytest.mark.skipif(not hod.USE_NUMBA, reason="numba is not installed")
+@pytest.mark.parametrize(
+    "hodr",
+    (hod.Zheng05, hod.Contreras13, hod.Tinker05),
+)
+def test_numba_occupation(hodr):
+    """Test that the jit-compiled occupations match the pure-numpy ones."""
+    # The grid reaches far into the lower tails of the erf-based occupations.
+    m = np.logspace(8, 16, 200)
+    params = {"fcb": 0.3} if hodr is hod.Contreras13 else {}
+    h = hodr(use_numba=True, **params)
+    h_np = hodr(**params)
+
+    assert np.allclose(
+        h._central_occupation(m), h_np._central_occupation(m), rtol=1e-12, atol=0
+    )
+    assert np.allclose(
+        h._satellite_occupation(m), h_np._satellite_occupation(m), rtol=1e-12, atol=0
+    )
+
+
+@pytest.mark.skipif(not hod.USE_NUMBA, reason="numba is not installed")
+def test_numba_scalar_precision():
+    """Test that the jit-compiled occupations keep double precision for scalar input."""
+    m = np.float64(10 ** 11.7)
+    z05 = Zheng05(use_numba=True)
+    nc = z05.central_occupation(m)
+    expected = 0.5 * (1 + sp.erf((11.7 - z05.params["M_min"]) / z05.params["sig_logm"]))
+
+    assert nc.dtype == np.float64
+    assert np.isclose(nc, expected, rtol=1e-12, atol=0)
+
+
+def test_zehavi_max_truncation():
+    """Test that the max zehavi model has no centrals above M_max."""
+    m = np.logspace(10, 15, 100)
+    z05m = Zehavi05WithMax(M_max=14)
+    nc = z05m.central_occupation(m)
+
+    assert np.all(nc[(m >= 10 ** z05m.params["M_min"]) & (m <= 1e14)] == 1)
+    assert np.all(nc[(m < 10 ** z05m.params["M_min"]) | (m > 1e14)] == 0)
+
+
+def test_zehavi_satellite():
+    """Test the Zehavi05 satellite occupation against its closed-form expression."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zehavi05()
+    ns = (m / 10 ** z05.params["M_1"]) ** z05.params["alpha"]
+
+    assert np.allclose(z05.satellite_occupation(m), ns)
+    assert np.allclose(z05.satellite_occupation(m[::-1]), ns[::-1])
+
+
+@pytest.mark.parametrize(
+    "hodr",
+    (hod.Zehavi05, hod.Zehavi05WithMax, hod.Zehavi05Marked, hod.ContinuousPowerLaw),
+)
+def test_power_law_scalar(hodr):
+    """Test that power-law satellite occupations accept a scalar mass."""
+    h = hodr()
+    m = np.array([1e13])
+
+    assert np.isclose(h.satellite_occupation(1e13), h.satellite_occupation(m)[0])
+
+
+def test_total_occupation_out():
+    """Test that the total occupation can be written into a given buffer."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zheng05()
+    buf = np.empty_like(m)
+
+    assert z05.total_occupation(m, out=buf) is buf
+    assert np.allclose(buf, z05.central_occupation(m) + z05.satellite_occupation(m))
+
+
+@pytest.mark.parametrize("hodr", (hod.Zheng05, hod.Contreras13))
+def test_central_occupation_batch(hodr):
+    """Test that batched central occupations match one-at-a-time evaluation."""
+    m = np.logspace(10, 15, 100)
+    M_min = np.linspace(11, 13, 5)
+    sig_logm = np.linspace(0.1, 0.5, 5)
+    h = hodr()
+
+    batch = h.central_occupation_batch(m, M_min=M_min, sig_logm=sig_logm)
+    assert batch.shape == (5, 100)
+    for i in range(5):
+        single = hodr(M_min=M_min[i], sig_logm=sig_logm[i]).central_occupation(m)
+        assert np.allclose(batch[i], single)
+
+    batch = h.central_occupation_batch(m, M_min=M_min[:, None], sig_logm=sig_logm)
+    assert batch.shape == (5, 5, 100)
+    assert np.allclose(
+        batch[2, 3], hodr(M_min=M_min[2], sig_logm=sig_logm[3]).central_occupation(m)
+    )
+
+    # Parameters that do not enter the central occupation still set the batch shape.
+    batch = h.central_occupation_batch(m, M_1=np.linspace(12, 13, 5))
+    assert batch.shape == (5, 100)
+    assert np.allclose(batch, h.central_occupation(m))
+
+    with pytest.raises(ValueError):
+        h.central_occupation_batch(m, not_a_param=M_min)
+
+    # Both paths return read-only arrays in the HOD dtype.
+    h32 = hodr(dtype=np.float32)
+    for batch in (
+        h32.central_occupation_batch(m),
+        h32.central_occupation_batch(m, M_min=M_min),
+    ):
+        assert batch.dtype == np.float32
+        assert not batch.flags.writeable
+
+    with pytest.raises(NotImplementedError):
+        hod.Zehavi05().central_occupation_batch(m, M_min=M_min)
+
+
+def test_integrate():
+    """Test the Gauss-Legendre mass integral against analytic results."""
+    z05 = Zehavi05()
+    integral = z05.integrate(lambda m: m ** -2, 10, 15)
+    assert np.isclose(integral, 1e-10 - 1e-15, rtol=1e-8, atol=0)
+
+    # Above M_min the total occupation of Zehavi05 is 1 + (m/M_1)^alpha.
+    m1, alpha = 10 ** z05.params["M_1"], z05.params["alpha"]
+    expected = (1e-12 - 1e-15) + (1e15 ** (alpha - 1) - 1e12 ** (alpha - 1)) / (
+        (alpha - 1) * m1 ** alpha
+    )
+    integral = z05.integrate(lambda m: z05.total_occupation(m) * m ** -2, 12, 15)
+    assert np.isclose(integral, expected, rtol=1e-8, atol=0)
+
+
+@pytest.mark.parametrize("central", (True, False))
+def test_central_condition(central):
+    """Test the satellite occupation and pairs with and without the central condition."""
+    m = np.logspace(10, 15, 100)
+    z05 = Zheng05(central=central)
+    nc, ns = z05.central_occupation(m), z05._satellite_occupation(m)
+
+    assert np.allclose(z05.satellite_occupation(m), nc * ns if central else ns)
+    assert np.allclose(
+        z05.cs_pairs(m),
+        z05.satellite_occupation(m) * (1 if central else z05.central_occupation(m)),
+    )
+
+
+def test_cs_pairs_override():
+    """Test that a subclass override of cs_pairs is used in the total pair function."""
+
+    class NoCrossPairs(Zehavi05):
+        def cs_pairs(self, m):
+            return np.zeros_like(m)
+
+    m = np.logspace(10, 15, 100)
+    h = NoCrossPairs(central=True)
+
+    assert np.all(h.cs_pairs(m) == 0)
+    assert np.allclose(h.total_pair_function(m), h.ss_pairs(m))
+
+
+def test_constant():
+    """Test that the constant HOD is a float step function at M_min."""
+    m = np.logspace(10, 15, 100)
+    const = hod.Constant(logA=1, M_min=12)
+    ns = const.satellite_occupation(m)
+
+    assert ns.dtype == np.float64
+    assert np.all(ns[m > 1e12] == 10.0)
+    assert np.all(ns[m <= 1e12] == 0)
+
+
+def test_log_grid_cache():
+    """Test that the logarithms of a mass grid are cached on the array."""
+    m = np.logspace(10, 15, 100)
+    log_m, log10_m = hod._log_grid(m)
+
+    assert np.allclose(log_m, np.log(m))
+    assert np.allclose(log10_m, np.log10(m))
+    assert hod._log_grid(m)[1] is log10_m
+    assert hod._log_grid(m.copy())[1] is not log10_m
+    assert not log10_m.flags.writeable
+
+    # The logarithms are dropped along with the mass grid.
+    n_cached = len(hod._log_grid_cache)
+    del m
+    assert len(hod._log_grid_cache) == n_cached - 1
+
+
+@pytest.mark.parametrize(
+    "hodr",
+    (hod.Zehavi05, hod.Zheng05, hod.Contreras13, hod.Tinker05, hod.Leauthaud11),
+)
+def test_scalar_mass(hodr):
+    """Test that occupations of a scalar or 0-d mass match those of an array."""
+    h = hodr()
+    m = np.array([1e12, 1e13])
+
+    for mass in (1e13, np.array(1e13)):
+        assert np.isclose(h.central_occupation(mass), h.central_occupation(m)[1])
+        assert np.isclose(h.satellite_occupation(mass), h.satellite_occupation(m)[1])
+
+    assert np.isclose(hod._log10(np.array(1e13)), 13)
+
+    # Subclasses may call the private kernels directly with a scalar.
+    for mass in (1e13, np.array(1e13)):
+        assert np.isclose(h._central_occupation(mass), h.central_occupation(m)[1])
+        assert np.isclose(h._satellite_occupation(mass), h._satellite_occupation(m)[1])
+
+
+@pytest.mark.parametrize(
+    "hodr",
+    (hod.Zehavi05, hod.Zheng05, hod.Contreras13, hod.Constant, hod.Leauthaud11),
+)
+def test_single_precision(hodr):
+    """Test that single-precision occupations are float32 and match double precision."""
+    m = np.logspace(10, 15, 100)
+    h32 = hodr(dtype=np.float32)
+    h64 = hodr()
+
+    assert h32.total_occupation(m).dtype == np.float32
+    assert h32.total_pair_function(m).dtype == np.float32
+    assert np.allclose(h32.total_occupation(m), h64.total_occupation(m), rtol=1e-4)
+    assert np.allclose(
+        h32.total_pair_function(m), h64.total_pair_function(m), rtol=1e-4
+    )
+
+
+@pytest.mark.parametrize("use_numba", (True, False))
+def test_tinker_below_mmin(use_numba):
+    """Test that Tinker05 satellites are zero (not nan) below M_min."""
+    if use_numba and not hod.USE_NUMBA:
+        pytest.skip("numba is not installed")
+
+    m = np.logspace(10, 15, 1000)
+    t05 = hod.Tinker05(use_numba=use_numba)
+    ns = t05.satellite_occupation(m)
+
+    assert np.all(np.isfinite(ns))
+    assert np.all(ns[m < 10 ** t05.params["M_min"]] == 0)
+
+
+def test_no_central():
+    """Test that HODs without centrals have a float zero central component."""
+    m = np.logspace(10, 15, 100)
+    cpl = hod.ContinuousPowerLaw()
+
+    assert cpl.central_occupation(m) == 0.0
+    assert isinstance(cpl.cs_pairs(m), float)
+    assert np.allclose(cpl.total_occupation(m), cpl.satellite_occupation(m))
+    assert np.allclose(cpl.total_pair_function(m), cpl.ss_pairs(m))